@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from scrapers.miliGoldScraper import scrape_milli_gold, interpret_price_change
 from scrapers.digikalaGoldScraper import digikala_gold_scraper
 from scrapers.talappGoldScraper import talapp_gold_scraper
@@ -10,41 +13,38 @@ from scrapers.melliGoldScraper import melli_gold_scraper
 from scrapers.goldikaGoldScraper import goldika_gold_scraper
 from scrapers.talaseaScraper import talasea_gold_scraper
 
-def run_gold_scraper(scraper_function, scraper_name):
+def show_scraper_results(scraper_name, data):
     """
-    General function to run any gold scraper and display results
-    
+    Display the results of a scraper run
+
     Args:
-        scraper_function: The scraper function to call
         scraper_name: Name of the scraper for display purposes
+        data: The dictionary returned by the scraper
     """
     print(f"* Using {scraper_name}")
     print("=" * 40)
-    
-    # Scrape the data
-    data = scraper_function()
-    
+
     # Check for errors
     if 'error' in data:
         print(f"❌ Error: {data['error']}")
         return
-    
+
     # Display the results
     print(f"✅ Successfully scraped data from {scraper_name}:")
     print(f"📊 قیمت ۱ گرم طلای ۱۸ عیار: {data['gold_price_18_carat']} {data['currency']}")
     print(f"📈 تغییرات: {data['price_change']}")
-    
+
     # Interpret the price change
     change_interpretation = interpret_price_change(data['price_change'])
     print(f"🔍 تفسیر تغییرات: {change_interpretation}")
-    
+
     # You can also access individual values
     price = data['gold_price_18_carat']
     change = data['price_change']
-    
+
     print(f"\n💰 Current gold price: {price} Rial")
     print(f"📊 Price change: {change}")
-    
+
     # Show trend
     if change and change.startswith('-'):
         print("📉 Trend: Decreasing (Bearish)")
@@ -53,26 +53,53 @@ def run_gold_scraper(scraper_function, scraper_name):
     else:
         print("❓ Trend: Unknown")
 
+def run_gold_scraper(scraper_function, scraper_name):
+    """
+    General function to run any gold scraper and display results
+
+    Args:
+        scraper_function: The scraper function to call
+        scraper_name: Name of the scraper for display purposes
+    """
+    show_scraper_results(scraper_name, scraper_function())
+
+# Available scrapers, keyed by the name used on the command line
+SCRAPERS = {
+    "milli": (scrape_milli_gold, "Milli Gold Scraper"),
+    "digikala": (digikala_gold_scraper, "Digikala Gold Scraper"),
+    "talapp": (talapp_gold_scraper, "Talapp Gold Scraper"),
+    "techno": (techno_gold_scraper, "Techno Gold Scraper"),
+    "wall": (wall_gold_scraper, "Wall Gold Scraper"),
+    "melli": (melli_gold_scraper, "Melli Gold Scraper"),
+    "goldika": (goldika_gold_scraper, "Goldika Gold Scraper"),
+    "talasea": (talasea_gold_scraper, "Talasea Gold Scraper")
+}
+
 def main():
+    parser = argparse.ArgumentParser(description="Run the gold scraper examples")
+    parser.add_argument('--scraper', choices=sorted(SCRAPERS),
+                        help="run a single scraper instead of all of them")
+    args = parser.parse_args()
+
     print("Gold Arbitrage Scraper Examples")
     print()
-    
-    # Define scrapers to run
-    scrapers = [
-        (scrape_milli_gold, "Milli Gold Scraper"),
-        (digikala_gold_scraper, "Digikala Gold Scraper"),
-        (talapp_gold_scraper, "Talapp Gold Scraper"),
-        (techno_gold_scraper, "Techno Gold Scraper"),
-        (wall_gold_scraper, "Wall Gold Scraper"),
-        (melli_gold_scraper, "Melli Gold Scraper"),
-        (goldika_gold_scraper, "Goldika Gold Scraper"),
-        (talasea_gold_scraper, "Talasea Gold Scraper")
-    ]
-    
-    # Run each scraper
-    for scraper_function, scraper_name in scrapers:
+
+    if args.scraper:
+        scraper_function, scraper_name = SCRAPERS[args.scraper]
         run_gold_scraper(scraper_function, scraper_name)
         print()
+        return
+
+    # The scrapers are independent I/O, so run them all in parallel and
+    # show each result as it arrives
+    with ThreadPoolExecutor(max_workers=len(SCRAPERS)) as executor:
+        futures = {
+            executor.submit(scraper_function): scraper_name
+            for scraper_function, scraper_name in SCRAPERS.values()
+        }
+        for future in as_completed(futures):
+            show_scraper_results(futures[future], future.result())
+            print()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import re
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
+
+import orjson
 from dataclasses import dataclass
 
 # Import all scrapers
@@ -17,11 +20,12 @@ from scrapers.melliGoldScraper import melli_gold_scraper
 from scrapers.goldikaGoldScraper import goldika_gold_scraper
 from scrapers.talaseaScraper import talasea_gold_scraper
 
-# Import utility functions
-from utils.price_converters import convert_persian_to_english_digits, remove_comma, format_number_with_commas
+# Compiled once at import: price normalization runs for every scraped source
+_NONNUM_RE = re.compile(r'[^\d.]')
+_FA_EN_TABLE = str.maketrans('۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩', '01234567890123456789')
 
 
-@dataclass
+@dataclass(slots=True)
 class GoldPrice:
     """Data class to represent gold price information"""
     source: str
@@ -32,7 +36,7 @@ class GoldPrice:
     raw_data: Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbitrageOpportunity:
     """Data class to represent an arbitrage opportunity"""
     buy_source: str
@@ -59,10 +63,22 @@ class GoldArbitrageFinder:
             "Talasea": talasea_gold_scraper
         }
         self.prices: List[GoldPrice] = []
+        self._sorted_prices: List[GoldPrice] = []
+        self._sorted_price_values: List[float] = []
         self.arbitrage_opportunities: List[ArbitrageOpportunity] = []
         # Verbose logging toggle via environment variable
         import os
         self.verbose = os.getenv('VERBOSE', '0') in ('1', 'true', 'True')
+        # Cap on concurrent scrapers; each scraper owns its host, so this
+        # doubles as the per-host politeness limit
+        self.max_workers = int(os.getenv('SCRAPE_MAX_WORKERS', str(len(self.scrapers))))
+        # Cache raw scraper payloads so repeated runs within the TTL skip
+        # the network entirely; 0 disables caching
+        self.cache_ttl = float(os.getenv('SCRAPE_CACHE_TTL', '60'))
+        self._scrape_cache: Dict[str, Tuple[float, Dict]] = {}
+        # Thread pool shared across scrape runs; created lazily on first
+        # use so a finder that never scrapes spawns no threads
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def log(self, message: str):
         if self.verbose:
@@ -79,74 +95,116 @@ class GoldArbitrageFinder:
             float: Normalized price value
         """
         try:
-            # Convert Persian digits to English
-            normalized = convert_persian_to_english_digits(price_str)
-            
-            # Remove commas and other formatting
-            normalized = remove_comma(normalized)
-            
-            # Remove any non-numeric characters except decimal point
-            import re
-            normalized = re.sub(r'[^\d.]', '', normalized)
-            
+            # Convert Persian/Arabic digits to English, then strip commas
+            # and any other formatting in one pass
+            normalized = _NONNUM_RE.sub('', price_str.translate(_FA_EN_TABLE))
+
             # Convert to float
-            return float(normalized)
-        except (ValueError, TypeError):
+            return float(normalized) if normalized else 0.0
+        except (ValueError, TypeError, AttributeError):
             return 0.0
     
+    def _scrape_one(self, source_name: str, scraper_func, timestamp: datetime) -> Optional[GoldPrice]:
+        """
+        Run a single scraper and parse its payload into a GoldPrice
+
+        Args:
+            source_name: Display name of the price source
+            scraper_func: The scraper function to call
+            timestamp: Timestamp to attach to the scraped price
+
+        Returns:
+            Optional[GoldPrice]: Parsed price, or None if scraping failed
+        """
+        try:
+            cached = self._scrape_cache.get(source_name)
+            if cached and time.monotonic() < cached[0]:
+                self.log(f"♻️  {source_name}: using cached result")
+                data = cached[1]
+            else:
+                self.log(f"📊 Scraping {source_name}...")
+
+                # Scrape the data; no politeness sleep needed - each
+                # source is a different host
+                data = scraper_func()
+
+                if self.cache_ttl > 0 and 'error' not in data:
+                    self._scrape_cache[source_name] = (time.monotonic() + self.cache_ttl, data)
+
+            # Check for errors
+            if 'error' in data:
+                self.log(f"❌ {source_name}: {data['error']}")
+                return None
+
+            # Normalize the price
+            normalized_price = self.normalize_price(data['gold_price_18_carat'])
+
+            if normalized_price <= 0:
+                self.log(f"⚠️  {source_name}: Could not parse price")
+                return None
+
+            gold_price = GoldPrice(
+                source=source_name,
+                price=normalized_price,
+                currency=data.get('currency', 'Rial'),
+                price_change=data.get('price_change', ''),
+                timestamp=timestamp,
+                raw_data=data
+            )
+            self.log(f"✅ {source_name}: {normalized_price:,.0f} {data.get('currency', 'Rial')}")
+            return gold_price
+
+        except Exception as e:
+            self.log(f"❌ {source_name}: Error - {str(e)}")
+            return None
+
     def scrape_all_sources(self) -> List[GoldPrice]:
         """
         Scrape gold prices from all available sources
-        
+
+        The scrapers are pure I/O (sockets and Selenium waits), so a thread
+        pool runs them all in parallel while keeping this API synchronous;
+        each site is a different host, so total latency is roughly the
+        slowest site instead of the sum.
+
         Returns:
             List[GoldPrice]: List of gold prices from all sources
         """
         self.log("🔍 Starting to scrape gold prices from all sources...")
         self.log("=" * 60)
-        
-        prices = []
+
         current_time = datetime.now()
-        
-        for source_name, scraper_func in self.scrapers.items():
-            try:
-                self.log(f"📊 Scraping {source_name}...")
-                
-                # Scrape the data
-                data = scraper_func()
-                
-                # Check for errors
-                if 'error' in data:
-                    self.log(f"❌ {source_name}: {data['error']}")
-                    continue
-                
-                # Normalize the price
-                normalized_price = self.normalize_price(data['gold_price_18_carat'])
-                
-                if normalized_price > 0:
-                    gold_price = GoldPrice(
-                        source=source_name,
-                        price=normalized_price,
-                        currency=data.get('currency', 'Rial'),
-                        price_change=data.get('price_change', ''),
-                        timestamp=current_time,
-                        raw_data=data
-                    )
-                    prices.append(gold_price)
-                    self.log(f"✅ {source_name}: {format_number_with_commas(str(int(normalized_price)))} {data.get('currency', 'Rial')}")
-                else:
-                    self.log(f"⚠️  {source_name}: Could not parse price")
-                
-                # Small delay to be respectful to websites
-                time.sleep(1)
-                
-            except Exception as e:
-                self.log(f"❌ {source_name}: Error - {str(e)}")
-                continue
-        
+        prices = []
+
+        # Reuse one pool across runs instead of spawning and joining
+        # fresh worker threads on every scrape
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix='scraper')
+        futures = [
+            self._executor.submit(self._scrape_one, name, func, current_time)
+            for name, func in self.scrapers.items()
+        ]
+        for future in as_completed(futures):
+            gold_price = future.result()
+            if gold_price:
+                prices.append(gold_price)
+
         self.prices = prices
+        # Sort once here; the summary, the report and the opportunity scan
+        # all consume the same ordered view. The bare float list lets the
+        # numeric scan skip attribute lookups on the dataclass objects.
+        self._sorted_prices = sorted(prices, key=lambda x: x.price)
+        self._sorted_price_values = [p.price for p in self._sorted_prices]
         self.log(f"\n📈 Successfully scraped {len(prices)} sources")
         return prices
-    
+
+    def close(self):
+        """Shut down the scraper thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     def find_arbitrage_opportunities(self, min_profit_percentage: float = 0.5) -> List[ArbitrageOpportunity]:
         """
         Find arbitrage opportunities between different sources
@@ -165,28 +223,43 @@ class GoldArbitrageFinder:
         self.log("=" * 60)
         
         opportunities = []
-        
-        # Compare all pairs of sources
-        for i, buy_price in enumerate(self.prices):
-            for j, sell_price in enumerate(self.prices):
-                if i != j:  # Don't compare source with itself
-                    
-                    # Calculate profit (sell high, buy low)
-                    profit_per_gram = sell_price.price - buy_price.price
-                    profit_percentage = (profit_per_gram / buy_price.price) * 100
-                    
-                    # Only consider opportunities with minimum profit
-                    if profit_percentage >= min_profit_percentage:
-                        opportunity = ArbitrageOpportunity(
-                            buy_source=buy_price.source,
-                            sell_source=sell_price.source,
-                            buy_price=buy_price.price,
-                            sell_price=sell_price.price,
-                            profit_per_gram=profit_per_gram,
-                            profit_percentage=profit_percentage,
-                            timestamp=datetime.now()
-                        )
-                        opportunities.append(opportunity)
+
+        # Profit is monotone in price: a cheaper buy and a pricier sell are
+        # always better. Sort once, then for each buy candidate walk the
+        # pricier sources from the top and stop at the profit cutoff,
+        # instead of checking every (buy, sell) pair.
+        if self._sorted_prices:
+            sorted_prices = self._sorted_prices
+            price_values = self._sorted_price_values
+        else:
+            sorted_prices = sorted(self.prices, key=lambda x: x.price)
+            price_values = [p.price for p in sorted_prices]
+        min_ratio = 1.0 + min_profit_percentage / 100.0
+
+        n = len(sorted_prices)
+        for i, buy_price in enumerate(sorted_prices):
+            buy_value = price_values[i]
+            cutoff = buy_value * min_ratio
+
+            for j in range(n - 1, i, -1):
+                sell_value = price_values[j]
+                if sell_value < cutoff:
+                    break  # Everything below can't meet the minimum profit
+
+                # Calculate profit (sell high, buy low)
+                profit_per_gram = sell_value - buy_value
+                profit_percentage = (profit_per_gram / buy_value) * 100
+
+                opportunity = ArbitrageOpportunity(
+                    buy_source=buy_price.source,
+                    sell_source=sorted_prices[j].source,
+                    buy_price=buy_value,
+                    sell_price=sell_value,
+                    profit_per_gram=profit_per_gram,
+                    profit_percentage=profit_percentage,
+                    timestamp=datetime.now()
+                )
+                opportunities.append(opportunity)
         
         # Sort by profit percentage (highest first)
         opportunities.sort(key=lambda x: x.profit_percentage, reverse=True)
@@ -212,15 +285,17 @@ class GoldArbitrageFinder:
         
         for i, opp in enumerate(self.arbitrage_opportunities[:5], 1):
             self.log(f"{i}. BUY from {opp.buy_source} → SELL to {opp.sell_source}")
-            self.log(f"   💵 Buy Price:  {format_number_with_commas(str(int(opp.buy_price)))} Rial")
-            self.log(f"   💰 Sell Price: {format_number_with_commas(str(int(opp.sell_price)))} Rial")
-            self.log(f"   📈 Profit:     {format_number_with_commas(str(int(opp.profit_per_gram)))} Rial per gram")
+            self.log(f"   💵 Buy Price:  {opp.buy_price:,.0f} Rial")
+            self.log(f"   💰 Sell Price: {opp.sell_price:,.0f} Rial")
+            self.log(f"   📈 Profit:     {opp.profit_per_gram:,.0f} Rial per gram")
             self.log(f"   📊 Profit %:   {opp.profit_percentage:.2f}%")
             self.log("")
         
         # Summary statistics
         if self.arbitrage_opportunities:
-            max_profit = max(opp.profit_percentage for opp in self.arbitrage_opportunities)
+            # Opportunities are sorted by profit percentage, so the first
+            # entry is the maximum - no extra scan needed
+            max_profit = self.arbitrage_opportunities[0].profit_percentage
             avg_profit = sum(opp.profit_percentage for opp in self.arbitrage_opportunities) / len(self.arbitrage_opportunities)
             
             self.log("📊 SUMMARY STATISTICS:")
@@ -239,15 +314,15 @@ class GoldArbitrageFinder:
         self.log("=" * 60)
         self.log(f"📅 Scraped at: {self.prices[0].timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
         self.log("")
-        
-        # Sort prices by value
-        sorted_prices = sorted(self.prices, key=lambda x: x.price)
-        
+
+        # Reuse the ordered view built in scrape_all_sources
+        sorted_prices = self._sorted_prices or sorted(self.prices, key=lambda x: x.price)
+
         self.log("💰 PRICES BY SOURCE (Lowest to Highest):")
         self.log("-" * 60)
         
         for price in sorted_prices:
-            self.log(f"🏪 {price.source:<12}: {format_number_with_commas(str(int(price.price))):>12} Rial")
+            self.log(f"🏪 {price.source:<12}: {price.price:>12,.0f} Rial")
             if price.price_change:
                 self.log(f"   📈 Change: {price.price_change}")
         
@@ -260,9 +335,9 @@ class GoldArbitrageFinder:
             
             self.log(f"\n📊 PRICE RANGE ANALYSIS:")
             self.log("-" * 60)
-            self.log(f"🔻 Lowest:  {format_number_with_commas(str(int(lowest.price)))} Rial ({lowest.source})")
-            self.log(f"🔺 Highest: {format_number_with_commas(str(int(highest.price)))} Rial ({highest.source})")
-            self.log(f"📏 Range:   {format_number_with_commas(str(int(price_range)))} Rial ({range_percentage:.2f}%)")
+            self.log(f"🔻 Lowest:  {lowest.price:,.0f} Rial ({lowest.source})")
+            self.log(f"🔺 Highest: {highest.price:,.0f} Rial ({highest.source})")
+            self.log(f"📏 Range:   {price_range:,.0f} Rial ({range_percentage:.2f}%)")
     
     def save_results_to_file(self, filename: str = None, results_folder: str = "arbitrage_results"):
         """Save results to a JSON file in a specific folder"""
@@ -280,15 +355,17 @@ class GoldArbitrageFinder:
         # Create full file path
         file_path = os.path.join(results_folder, filename)
         
+        # orjson serializes datetime objects natively, so no .isoformat()
+        # pre-conversion pass is needed
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "prices": [
                 {
                     "source": price.source,
                     "price": price.price,
                     "currency": price.currency,
                     "price_change": price.price_change,
-                    "timestamp": price.timestamp.isoformat()
+                    "timestamp": price.timestamp
                 }
                 for price in self.prices
             ],
@@ -300,14 +377,14 @@ class GoldArbitrageFinder:
                     "sell_price": opp.sell_price,
                     "profit_per_gram": opp.profit_per_gram,
                     "profit_percentage": opp.profit_percentage,
-                    "timestamp": opp.timestamp.isoformat()
+                    "timestamp": opp.timestamp
                 }
                 for opp in self.arbitrage_opportunities
             ]
         }
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
         
         self.log(f"\n💾 Results saved to: {file_path}")
     
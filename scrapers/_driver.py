@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shared headless Chrome pool for the Selenium-backed scrapers
+
+Starting Chrome costs one to two seconds, so instead of every scraper
+spinning up and quitting its own browser, drivers are borrowed from a
+small process-wide pool and reused for each scrape until the process
+exits. The pool is safe to use from concurrently running scrapers.
+"""
+
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+# How many Chrome processes may exist at once; concurrent scrapers
+# beyond this wait for a free driver. Only Wall, Techno and Talasea
+# still drive a browser, so one driver each covers a full parallel run.
+POOL_SIZE = 3
+
+_pool = queue.Queue()
+_all_drivers = []
+_created = 0
+_lock = threading.Lock()
+
+
+def _build_options():
+    chrome_options = Options()
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-plugins')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+    # The old --disable-images flag is a no-op on modern Chrome; these
+    # content-settings prefs actually stop images, stylesheets and fonts
+    # from downloading - we only need the rendered text. JavaScript is
+    # deliberately left on: the sites still scraped through Selenium are
+    # client-rendered, which is why they have not moved to plain HTTP
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.stylesheets': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+        'profile.default_content_setting_values.notifications': 2
+    })
+    return chrome_options
+
+
+# Built once at import; every pooled driver shares the same options
+_CHROME_OPTS = _build_options()
+
+# Third-party trackers and static assets the scrapers never need; the
+# CDP filter drops these requests before any bytes reach the renderer
+_BLOCKED_URLS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg',
+    '*.woff*', '*.css',
+]
+
+
+def _block_unneeded_requests(driver):
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
+    except Exception:
+        # CDP may be unavailable on non-Chromium drivers; the
+        # content-settings prefs still block most static assets
+        pass
+
+
+def _acquire():
+    global _created
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        pass
+
+    with _lock:
+        if _created < POOL_SIZE:
+            driver = webdriver.Chrome(options=_CHROME_OPTS)
+            _block_unneeded_requests(driver)
+            _all_drivers.append(driver)
+            _created += 1
+            return driver
+
+    # Pool is at capacity; wait for another scraper to return a driver
+    return _pool.get()
+
+
+@contextmanager
+def borrow_driver(page_load_timeout=30):
+    """
+    Borrow a headless Chrome driver from the pool for one scrape
+
+    The driver goes back to the pool afterwards with its cookies cleared
+    so scrapes stay isolated; a driver that died mid-scrape is dropped
+    and replaced lazily on the next borrow.
+    """
+    global _created
+    driver = _acquire()
+    try:
+        driver.set_page_load_timeout(page_load_timeout)
+        yield driver
+    finally:
+        try:
+            driver.delete_all_cookies()
+            _pool.put(driver)
+        except Exception:
+            with _lock:
+                _created -= 1
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def _shutdown():
+    for driver in _all_drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(_shutdown)
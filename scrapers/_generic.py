@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Data-driven scraper for the plain-HTTP gold sites
+
+Most of the HTTP scrapers are the same pipeline with different
+constants: fetch the page over the shared session, try the price
+pattern on the raw HTML, fall back to a strained soup walk, and push
+the match through a site-specific conversion chain. scrape_gold runs
+that pipeline from a small config dict so each site module only
+declares its URL, pattern and transform. Sites that also extract a
+change percentage or need DOM context keep their own module.
+"""
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers._http import SESSION
+
+# Only these tags are ever inspected, so skip building the rest of the tree
+_PRICE_TAGS = SoupStrainer(['div', 'span', 'p'])
+
+
+def scrape_gold(config):
+    """
+    Run one HTTP scrape described by a site config
+
+    Args:
+        config (dict): {
+            'url': page to fetch,
+            'price_regex': compiled pattern locating the formatted price,
+            'price_transform': callable turning the matched string into
+                the final comma-formatted rial figure,
+            'timeout': optional request timeout in seconds (default 10),
+        }
+
+    Returns:
+        dict: Scraped data in the shared result shape
+    """
+    result = {
+        'gold_price_18_carat': None,
+        'price_change': None,
+        'currency': 'ریال',
+        'unit': '۱ گرم'
+    }
+
+    try:
+        response = SESSION.get(config['url'], timeout=config.get('timeout', 10))
+        response.raise_for_status()
+
+        # Fast path: find the formatted price straight in the raw HTML
+        raw_match = config['price_regex'].search(response.text)
+        if raw_match:
+            result['gold_price_18_carat'] = config['price_transform'](raw_match.group(0))
+            return result
+
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=_PRICE_TAGS)
+
+        for text in soup.stripped_strings:
+            price_match = config['price_regex'].search(text)
+            if price_match:
+                result['gold_price_18_carat'] = config['price_transform'](price_match.group(0))
+                break
+
+        return result
+
+    except requests.RequestException as e:
+        return {'error': f'Network error: {str(e)}'}
+    except Exception as e:
+        return {'error': f'Parsing error: {str(e)}'}
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shared HTTP session for all scrapers
+
+A single module-level session keeps connections alive between scrape
+runs, so repeated polling reuses the TCP+TLS connection to each site
+instead of paying the handshake cost on every call. Responses are also
+cached in SQLite for a short window, so calls within the same price
+update period skip the network entirely.
+"""
+
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'fa,en;q=0.8',
+    # Brotli responses run ~15-25% smaller than gzip; requests decodes
+    # them transparently with the brotli package installed
+    'Accept-Encoding': 'br, gzip, deflate'
+}
+
+# Gold prices move on the order of minutes; 30s is short enough to stay
+# fresh and long enough to absorb bursts of repeated calls
+CACHE_EXPIRE_SECONDS = 30
+
+SESSION = CachedSession('gold_cache', backend='sqlite', expire_after=CACHE_EXPIRE_SECONDS)
+SESSION.headers.update(DEFAULT_HEADERS)
+
+# A couple of quick retries smooth over transient resets from the
+# flakier sites without inflating a failed scrape beyond ~1s
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
@@ -1,101 +1,89 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
- 
- 
- 
- 
-import time
+
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers._http import SESSION
 from utils.price_converters import remove_comma, toman_to_rial, format_number_with_commas
 from utils.price_converters import remove_zero_from_start
 
+# Only these tags are ever inspected, so skip building the rest of the tree
+_PRICE_TAGS = SoupStrainer(['div', 'span', 'p'])
+
+# Compiled once at import
+_PRICE_RE = re.compile(r'\d{1,3}(?:,\d{3})+')
+_CHANGE_RE = re.compile(r'([+-]?\d+\.?\d*\s*%)')
+
+# Single alternation scan instead of eight separate substring checks
+_POS_HINT_RE = re.compile(r'green|positive|up|increase')
+_NEG_HINT_RE = re.compile(r'red|negative|down|decrease')
+
 def melli_gold_scraper():
     """
-    Scrape gold price and price changes from Melli Gold website using Selenium
+    Scrape gold price and price changes from Melli Gold website
+    The page is server-rendered, so a plain HTTP request replaces the
+    old headless-Chrome session
     Returns a dictionary with the scraped data
     """
     url = "https://melligold.com/"
-    
+
     result = {
         'gold_price_18_carat': None,
         'price_change': None,
         'currency': 'ریال',
         'unit': '۱ گرم'
     }
-    
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--disable-images')
-    chrome_options.add_argument('--disable-plugins')
-    chrome_options.add_argument('--disable-extensions')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-    
-    driver = None
+
     try:
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        driver.set_page_load_timeout(60)
-        
-        try:
-            driver.get(url)
-            time.sleep(15)
-        except Exception:
-            pass
-        
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        for element in soup.find_all(['div', 'span', 'p']):
-            text = element.get_text().strip()
-            if re.search(r'[0-9]', text):
-                price_match = re.search(r'\d{1,3}(?:,\d{3})+', text)
+        response = SESSION.get(url, timeout=30)
+        response.raise_for_status()
+
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=_PRICE_TAGS)
+
+        # One walk over the text nodes finds both the price and the
+        # change figure instead of traversing the document twice; the
+        # node that produced the change is kept for sign inference
+        change_node = None
+        for node in soup.find_all(string=True):
+            if result['gold_price_18_carat'] is None:
+                price_match = _PRICE_RE.search(node)
                 if price_match:
                     toman_price = remove_comma(price_match.group(0))
                     rial_price = toman_to_rial(toman_price)
                     result['gold_price_18_carat'] = format_number_with_commas(rial_price)
-                    break
-
-        for element in soup.find_all(['div', 'span', 'p']):
-            text = element.get_text().strip()
-            if re.search(r'[0-9]', text):
-                change_match = re.search(r'([+-]?\d+\.?\d*\s*%)', text)
+            if result['price_change'] is None:
+                change_match = _CHANGE_RE.search(node)
                 if change_match:
                     result['price_change'] = remove_zero_from_start(change_match.group(1).replace(' ', ''))
-                    break
+                    change_node = node.parent
+            if result['gold_price_18_carat'] is not None and result['price_change'] is not None:
+                break
 
         if result['price_change'] and not result['price_change'].startswith(('+', '-')):
-            for element in soup.find_all(['div', 'span', 'p']):
-                text = element.get_text().strip()
-                if result['price_change'].replace('%', '') in text:
-                    classes = ' '.join(element.get('class', []))
-                    style = element.get('style', '')
+            # Check the element that held the percentage and its
+            # wrappers for a colour hint - no second document walk, and
+            # no risk of classifying off some unrelated element
+            element = change_node
+            while element is not None and not result['price_change'].startswith(('+', '-')):
+                classes = ' '.join(element.get('class', [])).lower()
+                style = (element.get('style') or '').lower()
+
+                if _POS_HINT_RE.search(classes):
+                    result['price_change'] = '+' + result['price_change']
+                elif _NEG_HINT_RE.search(classes):
+                    result['price_change'] = '-' + result['price_change']
+                elif 'color: green' in style or 'color:#green' in style:
+                    result['price_change'] = '+' + result['price_change']
+                elif 'color: red' in style or 'color:#red' in style:
+                    result['price_change'] = '-' + result['price_change']
+                else:
+                    element = element.parent
 
-                    if any(indicator in classes.lower() for indicator in ['green', 'positive', 'up', 'increase']):
-                        result['price_change'] = '+' + result['price_change']
-                        break
-                    elif any(indicator in classes.lower() for indicator in ['red', 'negative', 'down', 'decrease']):
-                        result['price_change'] = '-' + result['price_change']
-                        break
-                    elif 'color: green' in style.lower() or 'color:#green' in style.lower():
-                        result['price_change'] = '+' + result['price_change']
-                        break
-                    elif 'color: red' in style.lower() or 'color:#red' in style.lower():
-                        result['price_change'] = '-' + result['price_change']
-                        break
-        
         return result
-        
+
+    except requests.RequestException as e:
+        return {'error': f'Network error: {str(e)}'}
     except Exception as e:
-        return {'error': f'Selenium scraping error: {str(e)}'}
-    finally:
-        if driver:
-            driver.quit()
+        return {'error': f'Parsing error: {str(e)}'}
@@ -1,7 +1,27 @@
-import requests
 from bs4 import BeautifulSoup
 import re
 
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers._http import SESSION
+import requests
+
+# Compiled once at import; these run against every candidate element
+_PRICE_RIAL_RE = re.compile(r'([\d,]+,\d+).*?ریال')
+_GROUPED_PRICE_RE = re.compile(r'([\d,]+,\d+)')
+_FULL_PRICE_RE = re.compile(r'(\d{2},\d{3},\d{3})')
+_CHANGE_RE = re.compile(r'([+-]?\d+,?\d*%)')
+
+# The labels are plain literals, so substring tests beat firing up the
+# regex engine on every text node
+_PRICE_LABEL_WORDS = ('قیمت', 'گرم', 'طلای', '۱۸', 'عیار')
+_CHANGE_LABEL = 'تغییرات'
+
+# Single alternation scan instead of eight separate substring checks
+_POS_HINT_RE = re.compile(r'green|positive|up|increase')
+_NEG_HINT_RE = re.compile(r'red|negative|down|decrease')
+
 def scrape_milli_gold():
     """
     Scrape gold price and price changes from Milli Gold website
@@ -10,16 +30,14 @@ def scrape_milli_gold():
     url = "https://milli.gold/"
     
     try:
-        # Send GET request
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        # Send GET request over the shared keep-alive session
+        response = SESSION.get(url, timeout=10)
         response.raise_for_status()
         
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
+        # The site serves UTF-8; decoding here skips BeautifulSoup's
+        # charset detection pass over the Persian text
+        html_text = response.content.decode('utf-8', errors='replace')
+
         # Initialize result dictionary
         result = {
             'gold_price_18_carat': None,
@@ -27,93 +45,79 @@ def scrape_milli_gold():
             'currency': 'ریال',
             'unit': '۱ گرم'
         }
-        
-        # Look for gold price - try different possible selectors
-        # The price is likely in a div or span with specific classes or containing the price text
-        
-        # Method 1: Look for text containing "قیمت ۱ گرم طلای ۱۸ عیار"
-        price_elements = soup.find_all(string=re.compile(r'قیمت.*گرم.*طلای.*۱۸.*عیار'))
-        if price_elements:
-            # Find the parent element and look for price nearby
-            for element in price_elements:
-                parent = element.parent
-                # Look for price patterns in nearby elements
-                siblings = parent.find_next_siblings()
-                for sibling in siblings:
-                    price_match = re.search(r'([\d,]+,\d+)', sibling.get_text())
+
+        # Fast path: both figures are usually findable in the raw HTML
+        # without building a DOM. An unsigned change is left for the
+        # soup walk so sign inference has an element to work from
+        raw_price = _PRICE_RIAL_RE.search(html_text) or _FULL_PRICE_RE.search(html_text)
+        if raw_price:
+            result['gold_price_18_carat'] = raw_price.group(1)
+            raw_change = _CHANGE_RE.search(html_text)
+            if raw_change and raw_change.group(1).startswith(('+', '-')):
+                result['price_change'] = raw_change.group(1)
+                return result
+
+        # Parse HTML with the C-backed lxml parser; no SoupStrainer here
+        # because the label methods navigate siblings outside div/span/p
+        soup = BeautifulSoup(html_text, 'lxml')
+
+        # One walk over the document's text nodes replaces the old
+        # three-pass price search and two-pass change search. Label
+        # nodes ("قیمت ... ۱۸ عیار", "تغییرات") point at a price or
+        # percentage in a following sibling; any other node is tested
+        # against the direct patterns, and the first hit per field wins;
+        # the element that yields the change is kept for sign inference
+        change_node = None
+        for node in soup.find_all(string=True):
+            if result['gold_price_18_carat'] is None:
+                if all(word in node for word in _PRICE_LABEL_WORDS):
+                    for sibling in node.parent.find_next_siblings():
+                        price_match = _GROUPED_PRICE_RE.search(sibling.get_text())
+                        if price_match:
+                            result['gold_price_18_carat'] = price_match.group(1)
+                            break
+                else:
+                    price_match = _PRICE_RIAL_RE.search(node) or _FULL_PRICE_RE.search(node)
                     if price_match:
                         result['gold_price_18_carat'] = price_match.group(1)
-                        break
-        
-        # Method 2: Look for large numbers that could be prices (in Rial format)
-        if not result['gold_price_18_carat']:
-            # Look for patterns like "86,610,000" followed by "ریال"
-            price_pattern = re.compile(r'([\d,]+,\d+).*?ریال')
-            price_matches = soup.find_all(string=price_pattern)
-            for match in price_matches:
-                price_search = price_pattern.search(match)
-                if price_search:
-                    result['gold_price_18_carat'] = price_search.group(1)
-                    break
-        
-        # Method 3: Look in divs/spans that might contain price data
-        if not result['gold_price_18_carat']:
-            for element in soup.find_all(['div', 'span', 'p']):
-                text = element.get_text().strip()
-                # Look for 8-9 digit numbers (typical for gold prices in Rial)
-                price_match = re.search(r'(\d{2},\d{3},\d{3})', text)
-                if price_match:
-                    result['gold_price_18_carat'] = price_match.group(1)
-                    break
-        
-        # Look for price changes - likely contains percentage with "%" or "تغییرات"
-        change_elements = soup.find_all(string=re.compile(r'تغییرات'))
-        if change_elements:
-            for element in change_elements:
-                parent = element.parent
-                # Look for percentage in nearby elements
-                siblings = parent.find_next_siblings()
-                for sibling in siblings:
-                    # Updated regex to capture positive/negative signs
-                    change_match = re.search(r'([+-]?\d+,?\d*%)', sibling.get_text())
+
+            if result['price_change'] is None:
+                if _CHANGE_LABEL in node:
+                    for sibling in node.parent.find_next_siblings():
+                        change_match = _CHANGE_RE.search(sibling.get_text())
+                        if change_match:
+                            result['price_change'] = change_match.group(1)
+                            change_node = sibling
+                            break
+                else:
+                    change_match = _CHANGE_RE.search(node)
                     if change_match:
                         result['price_change'] = change_match.group(1)
-                        break
-        
-        # Alternative method for price changes
-        if not result['price_change']:
-            # Look for percentage patterns with signs
-            for element in soup.find_all(['div', 'span', 'p']):
-                text = element.get_text().strip()
-                # Look for patterns like "+1.47%", "-2.35%", "1.47%" (positive assumed)
-                change_match = re.search(r'([+-]?\d+,?\d*%)', text)
-                if change_match:
-                    result['price_change'] = change_match.group(1)
-                    break
+                        change_node = node.parent
+
+            if result['gold_price_18_carat'] and result['price_change']:
+                break
         
-        # If we found a percentage without explicit sign, check surrounding context for indicators
+        # If we found a percentage without explicit sign, look for
+        # colour hints on the element that held it and its wrappers
+        # instead of re-walking the whole document
         if result['price_change'] and not result['price_change'].startswith(('+', '-')):
-            # Look for green/red indicators or positive/negative keywords in the HTML
-            for element in soup.find_all(['div', 'span', 'p']):
-                text = element.get_text().strip()
-                if result['price_change'].replace('%', '') in text:
-                    # Check for color classes or text indicators
-                    classes = ' '.join(element.get('class', []))
-                    style = element.get('style', '')
-                    
-                    # Common patterns for positive/negative indicators
-                    if any(indicator in classes.lower() for indicator in ['green', 'positive', 'up', 'increase']):
-                        result['price_change'] = '+' + result['price_change']
-                        break
-                    elif any(indicator in classes.lower() for indicator in ['red', 'negative', 'down', 'decrease']):
-                        result['price_change'] = '-' + result['price_change']
-                        break
-                    elif 'color: green' in style.lower() or 'color:#green' in style.lower():
-                        result['price_change'] = '+' + result['price_change']
-                        break
-                    elif 'color: red' in style.lower() or 'color:#red' in style.lower():
-                        result['price_change'] = '-' + result['price_change']
-                        break
+            element = change_node
+            while element is not None and not result['price_change'].startswith(('+', '-')):
+                classes = ' '.join(element.get('class', [])).lower()
+                style = (element.get('style') or '').lower()
+
+                # Common patterns for positive/negative indicators
+                if _POS_HINT_RE.search(classes):
+                    result['price_change'] = '+' + result['price_change']
+                elif _NEG_HINT_RE.search(classes):
+                    result['price_change'] = '-' + result['price_change']
+                elif 'color: green' in style or 'color:#green' in style:
+                    result['price_change'] = '+' + result['price_change']
+                elif 'color: red' in style or 'color:#red' in style:
+                    result['price_change'] = '-' + result['price_change']
+                else:
+                    element = element.parent
         
         return result
         
@@ -1,72 +1,64 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
- 
- 
- 
- 
-import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.common.by import By
+
+
+
+
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers._driver import borrow_driver
 from utils.price_converters import remove_comma, toman_to_rial, format_number_with_commas
 
+# Only these tags are ever inspected, so skip building the rest of the tree
+_PRICE_TAGS = SoupStrainer(['div', 'span', 'p'])
+
+# Compiled once at import
+_PRICE_RE = re.compile(r'\d{1,3}(?:,\d{3})+')
+_WAIT_PRICE_RE = re.compile(r'[\d۰-۹]{1,3}(?:,[\d۰-۹]{3})+')
+
 def techno_gold_scraper():
     """
     Scrape gold price and price changes from Techno Gold website using Selenium
     Returns a dictionary with the scraped data
     """
     url = "https://technogold.gold/"
-    
+
     result = {
         'gold_price_18_carat': None,
         'price_change': None,
         'currency': 'ریال',
         'unit': '۱ گرم'
     }
-    
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--disable-images')
-    chrome_options.add_argument('--disable-plugins')
-    chrome_options.add_argument('--disable-extensions')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-    
-    driver = None
+
     try:
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        driver.set_page_load_timeout(30)
-        
-        try:
-            driver.get(url)
-            time.sleep(8)
-        except Exception:
-            pass
-        
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        for element in soup.find_all(['div', 'span', 'p']):
-            text = element.get_text().strip()
-            if re.search(r'[0-9]', text):
-                price_match = re.search(r'\d{1,3}(?:,\d{3})+', text)
-                if price_match:
-                    toman_price = remove_comma(price_match.group(0))
-                    rial_price = toman_to_rial(toman_price)
-                    result['gold_price_18_carat'] = format_number_with_commas(rial_price)
-                    break
-        
+        with borrow_driver(page_load_timeout=30) as driver:
+            try:
+                driver.get(url)
+                # Return as soon as a formatted price shows up instead of
+                # sleeping for the worst case
+                WebDriverWait(driver, 15).until(
+                    lambda d: _WAIT_PRICE_RE.search(d.find_element(By.TAG_NAME, 'body').text)
+                )
+            except Exception:
+                pass
+
+            page_source = driver.page_source
+
+        soup = BeautifulSoup(page_source, 'lxml', parse_only=_PRICE_TAGS)
+
+        for text in soup.stripped_strings:
+            price_match = _PRICE_RE.search(text)
+            if price_match:
+                toman_price = remove_comma(price_match.group(0))
+                rial_price = toman_to_rial(toman_price)
+                result['gold_price_18_carat'] = format_number_with_commas(rial_price)
+                break
+
         return result
-        
+
     except Exception as e:
         return {'error': f'Selenium scraping error: {str(e)}'}
-    finally:
-        if driver:
-            driver.quit()
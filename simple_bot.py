@@ -9,8 +9,13 @@ import os
 import sys
 import time
 import json
+import functools
 import logging
+import statistics
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass
@@ -45,6 +50,27 @@ class TelegramSender:
         self.bot_token = bot_token
         self.channel_id = channel_id
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
+        # Built once; every send hits the same endpoint
+        self._send_url = f"{self.base_url}/sendMessage"
+        # One session per sender keeps the TLS connection to
+        # api.telegram.org alive across the several calls each report
+        # needs, instead of a fresh handshake per message. The adapter
+        # pins the pool so reuse survives the 4-minute cycle and lets
+        # urllib3 retry transient API errors with backoff
+        self.session = requests.Session()
+        # POST has to be opted into allowed_methods or the
+        # status_forcelist never applies to sendMessage (urllib3 only
+        # retries listed statuses on methods it considers retryable).
+        # A 5xx after the API processed the send can duplicate a
+        # report, but for this bot a repeated report beats a dropped one
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"})
+        )
+        self.session.mount('https://', adapter)
     
     def send_message(self, text: str, parse_mode: str = "HTML") -> bool:
         """
@@ -58,15 +84,21 @@ class TelegramSender:
             bool: True if successful, False otherwise
         """
         try:
-            url = f"{self.base_url}/sendMessage"
             data = {
                 'chat_id': self.channel_id,
                 'text': text,
                 'parse_mode': parse_mode,
                 'disable_web_page_preview': True
             }
-            
-            response = requests.post(url, data=data, timeout=30)
+
+            # orjson serializes the payload faster than the form/stdlib
+            # json encoding requests would do itself
+            response = self.session.post(
+                self._send_url,
+                data=orjson.dumps(data),
+                headers={'Content-Type': 'application/json'},
+                timeout=30
+            )
             response.raise_for_status()
             
             logger.info("Message sent to Telegram successfully")
@@ -93,21 +125,24 @@ class TelegramSender:
         if len(text) <= MAX_MESSAGE_LENGTH:
             return self.send_message(text, parse_mode)
         
-        # Split message into chunks
+        # Split message into chunks on line boundaries; lines are
+        # collected in a list and joined once per chunk rather than
+        # concatenated onto a growing string
         chunks = []
-        current_chunk = ""
-        
-        lines = text.split('\n')
-        for line in lines:
-            if len(current_chunk + line + '\n') <= MAX_MESSAGE_LENGTH:
-                current_chunk += line + '\n'
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = line + '\n'
-        
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        current_lines = []
+        current_len = 0
+
+        for line in text.split('\n'):
+            line_len = len(line) + 1
+            if current_len + line_len > MAX_MESSAGE_LENGTH and current_lines:
+                chunks.append('\n'.join(current_lines).strip())
+                current_lines = []
+                current_len = 0
+            current_lines.append(line)
+            current_len += line_len
+
+        if current_lines:
+            chunks.append('\n'.join(current_lines).strip())
         
         # Send each chunk
         success = True
@@ -121,6 +156,11 @@ class TelegramSender:
         return success
 
 
+# Single process-wide sender; every call site reuses its pooled TLS
+# connection for the bot's lifetime instead of rebuilding a session
+_TG_SENDER = TelegramSender(TELEGRAM_BOT_TOKEN, TELEGRAM_CHANNEL_ID)
+
+
 class ArbitrageReporter:
     """Class to format arbitrage results for Telegram"""
     
@@ -139,98 +179,117 @@ class ArbitrageReporter:
         """
         if not finder.prices:
             return "❌ No gold prices could be scraped at this time."
-        
+
+        # Pieces are collected in a list and joined once at the end;
+        # repeated += on the growing report string copied it every time
+        parts = []
+
         # Header
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        message = f"🏆 <b>GOLD ARBITRAGE REPORT</b>\n"
-        message += f"📅 {timestamp}\n"
-        message += f"📊 Sources: {len(finder.prices)}\n\n"
-        
-        # All prices by source
+        # f-string datetime formatting skips strftime's per-call
+        # format-string parse
+        parts.append(f"🏆 <b>GOLD ARBITRAGE REPORT</b>\n")
+        parts.append(f"📅 {datetime.now():%Y-%m-%d %H:%M:%S}\n")
+        parts.append(f"📊 Sources: {len(finder.prices)}\n\n")
+
+        # All prices by source; the finder already sorted them once in
+        # scrape_all_sources, so reuse that view instead of re-sorting
         if finder.prices:
-            sorted_prices = sorted(finder.prices, key=lambda x: x.price)
-            
-            message += f"💰 <b>ALL GOLD PRICES (18K per gram):</b>\n"
+            sorted_prices = finder._sorted_prices or sorted(finder.prices, key=lambda x: x.price)
+
+            parts.append(f"💰 <b>ALL GOLD PRICES (18K per gram):</b>\n")
             for i, price in enumerate(sorted_prices, 1):
-                message += f"{i:2d}. {price.source:<12}: {self.format_price(price.price):>12} Rial"
+                parts.append(f"{i:2d}. {price.source:<12}: {self.format_price(price.price):>12} Rial")
                 if price.price_change:
-                    message += f" ({price.price_change})"
-                message += "\n"
-            
+                    parts.append(f" ({price.price_change})")
+                parts.append("\n")
+
             # Price range analysis
             lowest = sorted_prices[0]
             highest = sorted_prices[-1]
             price_range = highest.price - lowest.price
             range_percentage = (price_range / lowest.price) * 100
-            
-            message += f"\n📊 <b>PRICE ANALYSIS:</b>\n"
-            message += f"🔻 Lowest:  {self.format_price(lowest.price)} Rial ({lowest.source})\n"
-            message += f"🔺 Highest: {self.format_price(highest.price)} Rial ({highest.source})\n"
-            message += f"📏 Range:   {self.format_price(price_range)} Rial ({range_percentage:.2f}%)\n\n"
-        
+
+            parts.append(f"\n📊 <b>PRICE ANALYSIS:</b>\n")
+            parts.append(f"🔻 Lowest:  {self.format_price(lowest.price)} Rial ({lowest.source})\n")
+            parts.append(f"🔺 Highest: {self.format_price(highest.price)} Rial ({highest.source})\n")
+            parts.append(f"📏 Range:   {self.format_price(price_range)} Rial ({range_percentage:.2f}%)\n\n")
+
         # All arbitrage opportunities
         if finder.arbitrage_opportunities:
-            message += f"🎯 <b>ALL ARBITRAGE OPPORTUNITIES:</b>\n"
-            message += f"Found {len(finder.arbitrage_opportunities)} opportunities\n\n"
-            
+            opportunities = finder.arbitrage_opportunities
+            parts.append(f"🎯 <b>ALL ARBITRAGE OPPORTUNITIES:</b>\n")
+            parts.append(f"Found {len(opportunities)} opportunities\n\n")
+
+            # Summary statistics accumulate while the rows render; the
+            # list used to be traversed five more times afterwards
+            max_profit_percentage = min_profit_percentage = opportunities[0].profit_percentage
+            sum_profit_percentage = 0.0
+            total_profit_potential = 0.0
+            best_opp = opportunities[0]
+
             # Show ALL opportunities (not just top 3)
-            for i, opp in enumerate(finder.arbitrage_opportunities, 1):
-                message += f"{i:2d}. <b>{opp.buy_source}</b> → <b>{opp.sell_source}</b>\n"
-                message += f"    💵 Buy:  {self.format_price(opp.buy_price)} Rial\n"
-                message += f"    💰 Sell: {self.format_price(opp.sell_price)} Rial\n"
-                message += f"    📈 Profit: {self.format_price(opp.profit_per_gram)} Rial\n"
-                message += f"    🎯 Profit %: {opp.profit_percentage:.2f}%\n\n"
-            
-            # Summary statistics
-            max_profit_percentage = max(opp.profit_percentage for opp in finder.arbitrage_opportunities)
-            min_profit_percentage = min(opp.profit_percentage for opp in finder.arbitrage_opportunities)
-            avg_profit_percentage = sum(opp.profit_percentage for opp in finder.arbitrage_opportunities) / len(finder.arbitrage_opportunities)
-            
-            # Find best opportunity by profit amount (Rial)
-            best_opp = max(finder.arbitrage_opportunities, key=lambda x: x.profit_per_gram)
-            max_profit_rial = best_opp.profit_per_gram
-            
-            message += f"📊 <b>OPPORTUNITY STATISTICS:</b>\n"
-            message += f"🎯 Best Profit: {self.format_price(max_profit_rial)} Rial ({best_opp.buy_source} → {best_opp.sell_source})\n"
-            message += f"📈 Best Profit %: {max_profit_percentage:.2f}%\n"
-            message += f"📉 Lowest Profit %: {min_profit_percentage:.2f}%\n"
-            message += f"📊 Average Profit %: {avg_profit_percentage:.2f}%\n"
-            message += f"🔢 Total Opportunities: {len(finder.arbitrage_opportunities)}\n"
-            
+            for i, opp in enumerate(opportunities, 1):
+                parts.append(f"{i:2d}. <b>{opp.buy_source}</b> → <b>{opp.sell_source}</b>\n")
+                parts.append(f"    💵 Buy:  {self.format_price(opp.buy_price)} Rial\n")
+                parts.append(f"    💰 Sell: {self.format_price(opp.sell_price)} Rial\n")
+                parts.append(f"    📈 Profit: {self.format_price(opp.profit_per_gram)} Rial\n")
+                parts.append(f"    🎯 Profit %: {opp.profit_percentage:.2f}%\n\n")
+
+                pct = opp.profit_percentage
+                if pct > max_profit_percentage:
+                    max_profit_percentage = pct
+                elif pct < min_profit_percentage:
+                    min_profit_percentage = pct
+                sum_profit_percentage += pct
+                total_profit_potential += opp.profit_per_gram
+                if opp.profit_per_gram > best_opp.profit_per_gram:
+                    best_opp = opp
+
+            avg_profit_percentage = sum_profit_percentage / len(opportunities)
+
+            parts.append(f"📊 <b>OPPORTUNITY STATISTICS:</b>\n")
+            parts.append(f"🎯 Best Profit: {self.format_price(best_opp.profit_per_gram)} Rial ({best_opp.buy_source} → {best_opp.sell_source})\n")
+            parts.append(f"📈 Best Profit %: {max_profit_percentage:.2f}%\n")
+            parts.append(f"📉 Lowest Profit %: {min_profit_percentage:.2f}%\n")
+            parts.append(f"📊 Average Profit %: {avg_profit_percentage:.2f}%\n")
+            parts.append(f"🔢 Total Opportunities: {len(opportunities)}\n")
+
             # Profit analysis
-            total_profit_potential = sum(opp.profit_per_gram for opp in finder.arbitrage_opportunities)
-            message += f"💰 Total Profit Potential: {self.format_price(total_profit_potential)} Rial\n"
+            parts.append(f"💰 Total Profit Potential: {self.format_price(total_profit_potential)} Rial\n")
         else:
-            message += "❌ No arbitrage opportunities found with current criteria.\n"
-            message += "💡 This means all prices are very similar across sources.\n"
-        
+            parts.append("❌ No arbitrage opportunities found with current criteria.\n")
+            parts.append("💡 This means all prices are very similar across sources.\n")
+
         # Market insights
         if finder.prices and len(finder.prices) > 1:
-            message += f"\n🔍 <b>MARKET INSIGHTS:</b>\n"
-            
-            # Price volatility
+            parts.append(f"\n🔍 <b>MARKET INSIGHTS:</b>\n")
+
+            # Price volatility; the statistics helpers run in C and
+            # replace the hand-rolled two-pass mean/std loops
             prices = [p.price for p in finder.prices]
-            avg_price = sum(prices) / len(prices)
-            price_std = (sum((p - avg_price) ** 2 for p in prices) / len(prices)) ** 0.5
+            avg_price = statistics.fmean(prices)
+            price_std = statistics.pstdev(prices, mu=avg_price)
             volatility = (price_std / avg_price) * 100
-            
-            message += f"📊 Average Price: {self.format_price(avg_price)} Rial\n"
-            message += f"📈 Price Volatility: {volatility:.2f}%\n"
-            
+
+            parts.append(f"📊 Average Price: {self.format_price(avg_price)} Rial\n")
+            parts.append(f"📈 Price Volatility: {volatility:.2f}%\n")
+
             # Market efficiency
             if volatility < 0.5:
-                message += f"✅ Market is highly efficient (low volatility)\n"
+                parts.append(f"✅ Market is highly efficient (low volatility)\n")
             elif volatility < 1.0:
-                message += f"⚖️ Market shows moderate efficiency\n"
+                parts.append(f"⚖️ Market shows moderate efficiency\n")
             else:
-                message += f"⚠️ Market shows high volatility (good for arbitrage)\n"
-        
+                parts.append(f"⚠️ Market shows high volatility (good for arbitrage)\n")
+
         # Footer
-        message += f"\n🤖 <i>Automated Gold Arbitrage Bot</i>"
-        
-        return message
+        parts.append(f"\n🤖 <i>Automated Gold Arbitrage Bot</i>")
+
+        return ''.join(parts)
     
-    def format_price(self, price: float) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def format_price(price: float) -> str:
         """Format price with commas"""
         return f"{int(price):,}"
     
@@ -252,6 +311,11 @@ class ArbitrageReporter:
             return False
 
 
+# The reporter is stateless apart from the sender it wraps, so one
+# instance serves every cycle
+_REPORTER = ArbitrageReporter(_TG_SENDER)
+
+
 def check_requirements():
     """Check if all requirements are met"""
     print("🔍 Checking requirements...")
@@ -280,7 +344,7 @@ def test_telegram_connection():
     try:
         # Perform a lightweight getMe API call instead of sending a message
         url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/getMe"
-        response = requests.get(url, timeout=15)
+        response = _TG_SENDER.session.get(url, timeout=15)
         response.raise_for_status()
         return True
     except Exception:
@@ -291,25 +355,30 @@ def run_arbitrage_analysis():
     """Run one arbitrage analysis and send to Telegram"""
     try:
         logger.info("Starting arbitrage analysis...")
-        
-        # Initialize components
-        telegram_sender = TelegramSender(TELEGRAM_BOT_TOKEN, TELEGRAM_CHANNEL_ID)
-        reporter = ArbitrageReporter(telegram_sender)
-        
-        # Run arbitrage analysis
+
+        # Process-wide sender and reporter; only the finder is rebuilt
+        # per cycle, since it carries that run's scraped state
+        telegram_sender = _TG_SENDER
+        reporter = _REPORTER
+
+        # Run arbitrage analysis; a fresh finder is built every cycle,
+        # so release its thread pool once this run is done
         finder = GoldArbitrageFinder()
-        finder.scrape_all_sources()
-        
-        if not finder.prices:
-            error_message = "❌ <b>ARBITRAGE ANALYSIS FAILED</b>\n\nNo gold prices could be scraped at this time. Please check the scrapers."
-            telegram_sender.send_message(error_message)
-            return False
-        
-        # Find arbitrage opportunities
-        finder.find_arbitrage_opportunities(min_profit_percentage=0.5)
-        
-        # Send report to Telegram
-        success = reporter.send_arbitrage_report(finder)
+        try:
+            finder.scrape_all_sources()
+
+            if not finder.prices:
+                error_message = "❌ <b>ARBITRAGE ANALYSIS FAILED</b>\n\nNo gold prices could be scraped at this time. Please check the scrapers."
+                telegram_sender.send_message(error_message)
+                return False
+
+            # Find arbitrage opportunities
+            finder.find_arbitrage_opportunities(min_profit_percentage=0.5)
+
+            # Send report to Telegram
+            success = reporter.send_arbitrage_report(finder)
+        finally:
+            finder.close()
         
         if success:
             logger.info("Arbitrage report sent to Telegram successfully")
@@ -322,9 +391,8 @@ def run_arbitrage_analysis():
         logger.error(f"Error in arbitrage analysis: {e}")
         # Send error message to Telegram
         try:
-            telegram_sender = TelegramSender(TELEGRAM_BOT_TOKEN, TELEGRAM_CHANNEL_ID)
             error_message = f"❌ <b>ARBITRAGE BOT ERROR</b>\n\nError: {str(e)}"
-            telegram_sender.send_message(error_message)
+            _TG_SENDER.send_message(error_message)
         except:
             pass
         
@@ -353,23 +421,33 @@ def main():
     print("Press Ctrl+C to stop")
     print()
     
-    # Main loop
+    # Main loop; the next tick is scheduled against a monotonic clock
+    # so a slow scrape or send shortens the wait instead of pushing
+    # every following analysis later
+    loop_every = 240  # 4 minutes
+    next_tick = time.monotonic()
     try:
         while True:
-            print(f"⏰ {datetime.now().strftime('%H:%M:%S')} - Running analysis...")
-            
+            print(f"⏰ {datetime.now():%H:%M:%S} - Running analysis...")
+
             # Run analysis
             success = run_arbitrage_analysis()
-            
+
             if success:
                 print("✅ Analysis completed successfully")
             else:
                 print("❌ Analysis failed")
-            
-            # Wait 4 minutes (240 seconds)
-            print("⏳ Waiting 4 minutes until next analysis...")
-            time.sleep(240)  # 4 minutes
-            
+
+            next_tick += loop_every
+            wait = next_tick - time.monotonic()
+            if wait <= 0:
+                # The cycle overran its slot; realign rather than
+                # firing a burst of catch-up runs
+                next_tick = time.monotonic() + loop_every
+                wait = loop_every
+            print("⏳ Waiting until next analysis...")
+            time.sleep(wait)
+
     except KeyboardInterrupt:
         print("\n🛑 Stopping bot...")
         print("✅ Bot stopped")
@@ -1,28 +1,26 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import functools
+
+# Built once; str.translate maps all digits in a single C-level pass
+_PERSIAN_TO_ENGLISH = str.maketrans('۰۱۲۳۴۵۶۷۸۹', '0123456789')
+
+
+@functools.lru_cache(maxsize=4096)
 def convert_persian_to_english_digits(persian_text):
     """
     Convert Persian digits to English digits
-    
+
     Args:
         persian_text (str): Text containing Persian digits
-        
+
     Returns:
         str: Text with English digits
     """
-    persian_to_english = {
-        '۰': '0', '۱': '1', '۲': '2', '۳': '3', '۴': '4',
-        '۵': '5', '۶': '6', '۷': '7', '۸': '8', '۹': '9'
-    }
-    
     if persian_text is None:
         return ""
-    english_text = persian_text
-    for persian, english in persian_to_english.items():
-        english_text = english_text.replace(persian, english)
-    
-    return english_text
+    return persian_text.translate(_PERSIAN_TO_ENGLISH)
 
 
 def convert_milligram_price_to_gram_price(milligram_price):
@@ -66,6 +64,7 @@ def toman_to_rial(toman_price):
     return toman_price + "0"
 
 
+@functools.lru_cache(maxsize=4096)
 def format_number_with_commas(number_str):
     """
     Format a number string with commas every 3 digits from the right
@@ -80,15 +79,14 @@ def format_number_with_commas(number_str):
     if not number_str:
         return ""
     clean_number = number_str.replace(',', '')
-    
-    # Add commas every 3 digits from the right
-    if len(clean_number) <= 3:
+
+    # Non-numeric input (stray text from a scraper) passes through
+    # unchanged rather than raising
+    if not clean_number.lstrip('-').isdigit():
         return clean_number
-    
-    # Reverse the string, add commas every 3 characters, then reverse back
-    reversed_number = clean_number[::-1]
-    formatted_reversed = ','.join(reversed_number[i:i+3] for i in range(0, len(reversed_number), 3))
-    return formatted_reversed[::-1]
+
+    # CPython's integer formatter groups the digits in a single C call
+    return f"{int(clean_number):,}"
 
 def remove_zero_from_start(price):
     """